@@ -2,16 +2,19 @@ import os
 import streamlit as st
 from openai import OpenAI
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+@st.cache_resource
+def get_client() -> OpenAI:
+    """Return a shared OpenAI client so its connection pool survives reruns."""
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def generate_video(prompt: str, duration: int = 6):
-    """Generate a video using OpenAI Sora."""
-    response = client.videos.generate(
+@st.cache_data(ttl=3600, show_spinner=False)
+def generate_video(prompt: str, duration: int = 6, resolution: str = "720p"):
+    """Generate a video using OpenAI Sora (cached per prompt, duration and resolution)."""
+    response = get_client().videos.generate(
         model="sora-1",
         prompt=prompt,
         duration=duration,  # seconds
-        resolution="720p"
+        resolution=resolution
     )
     video_url = response.data[0].url  # Extract video URL from response
     return video_url
@@ -26,6 +29,7 @@ def main():
 
     prompt = st.text_area("Enter your video prompt", height=150)
     duration = st.slider("Video length (seconds)", 3, 20, 6)
+    resolution = st.selectbox("Resolution", ["480p", "720p"], index=1)
 
     if st.button("Generate Video"):
         if not prompt.strip():
@@ -33,7 +37,7 @@ def main():
             return
         try:
             with st.spinner("Generating video with Sora..."):
-                video_url = generate_video(prompt, duration)
+                video_url = generate_video(prompt, duration, resolution)
             st.success("Video generated.")
             st.video(video_url)
             st.markdown(f"[Download video]({video_url})")